@@ -0,0 +1,24 @@
+# ================================
+# GUNICORN CONFIGURATION
+# Start with: gunicorn app:app
+# (gunicorn picks up this file automatically from the working directory)
+# ================================
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Key breakers, the response cache, request coalescing and the connection
+# pool all live in the process, so default to a single worker and scale with
+# threads: requests spend almost all their time waiting on OpenAI. Threads
+# never exceed OPENAI_POOL_SIZE so each thread can always hold a pooled
+# connection. Set WEB_CONCURRENCY to run more workers (each keeps its own state).
+worker_class = "gthread"
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+threads = min(int(os.environ.get('GUNICORN_THREADS', 32)), int(os.environ.get('OPENAI_POOL_SIZE', 32)))
+
+# Under gthread this is a worker heartbeat: a worker whose main loop stops
+# responding for this long is restarted. It does not limit individual
+# requests, which can run longer (up to keys x (5s connect + 30s read) plus backoff).
+timeout = 60
+keepalive = 5
@@ -0,0 +1,102 @@
+import pytest
+
+from app import GPTAPIKeyManager, GPTChatManager, KeyBreaker
+
+
+class StubResponse:
+    def __init__(self, status_code, content=b'{"choices": []}'):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+        self.reason = "Stub"
+
+    def close(self):
+        pass
+
+
+def make_manager(statuses, keys=("k1", "k2", "k3")):
+    """GPTChatManager whose session answers with the given status codes in turn"""
+    manager = GPTChatManager(list(keys))
+    sent = []
+
+    def send(prepared, **kwargs):
+        sent.append(prepared.headers["Authorization"])
+        return StubResponse(statuses[min(len(sent), len(statuses)) - 1])
+
+    manager.session.send = send
+    return manager, sent
+
+
+def expire_cooldown(breaker: KeyBreaker):
+    breaker.opened_at -= breaker.cooldown
+
+
+def test_bad_request_fails_fast_without_touching_breakers():
+    manager, sent = make_manager([400])
+
+    for _ in range(5):
+        with pytest.raises(Exception, match="status 400"):
+            manager.send_message("too long")
+
+    assert len(sent) == 5
+    assert manager.key_manager.get_available_keys_count() == 3
+    assert all(b.state == KeyBreaker.CLOSED for b in manager.key_manager.breakers.values())
+
+
+def test_server_errors_rotate_keys_and_trip_breakers():
+    manager, sent = make_manager([500])
+
+    for _ in range(5):
+        with pytest.raises(Exception, match="exhausted"):
+            manager.send_message("hello")
+
+    assert len(sent) == 15
+    assert manager.key_manager.get_available_keys_count() == 0
+    assert manager.key_manager.get_current_key() is None
+
+
+def test_invalid_key_is_disabled_and_next_key_used():
+    manager, sent = make_manager([401, 200])
+
+    manager.send_message("hello")
+
+    assert sent == ["Bearer k1", "Bearer k2"]
+    assert manager.key_manager.breakers["k1"].invalid
+    assert manager.key_manager.get_available_keys_count() == 2
+
+
+def test_failure_rotates_to_next_key():
+    key_manager = GPTAPIKeyManager(["k1", "k2"])
+
+    assert key_manager.get_current_key() == "k1"
+    key_manager.record_failure("k1")
+    assert key_manager.get_current_key() == "k2"
+
+
+def test_cooled_down_keys_count_as_available_without_rotation():
+    key_manager = GPTAPIKeyManager(["k1", "k2", "k3"])
+    for key in ("k1", "k2", "k3"):
+        for _ in range(5):
+            key_manager.record_failure(key)
+    assert key_manager.get_available_keys_count() == 0
+
+    for breaker in key_manager.breakers.values():
+        expire_cooldown(breaker)
+    key = key_manager.get_current_key()
+    key_manager.record_success(key)
+
+    assert key_manager.get_available_keys_count() == 3
+
+
+def test_half_open_breaker_allows_single_probe():
+    breaker = KeyBreaker()
+    for _ in range(5):
+        breaker.record_failure()
+    assert not breaker.allow_request()
+
+    expire_cooldown(breaker)
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == KeyBreaker.OPEN